@@ -0,0 +1,127 @@
+"""On-disk cache of parsed prompt data."""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+from ..model import Argument, PromptData
+from ..interfaces import LoggerInterface, DefaultLogger
+
+# Bump when the cached entry layout or PromptData fields change
+CACHE_VERSION = 1
+
+
+def get_prompt_cache_path(
+    cache_dir: Path, folder: Path, skip_frontmatter: bool
+) -> Path:
+    """
+    Get the prompt cache file for a scan root.
+
+    Each folder and skip_frontmatter combination gets its own file, so
+    servers loading different folders don't evict each other's entries.
+    """
+    key = f"{folder}\0{skip_frontmatter}".encode("utf-8")
+    return cache_dir / "prompts" / f"{hashlib.sha256(key).hexdigest()[:16]}.json"
+
+
+class PromptCache:
+    """
+    Cache of PromptData keyed by markdown file path.
+
+    An entry is only reused when the file's (mtime_ns, size) stamp and the
+    scan options that affect parsing are unchanged. Entries that are not
+    looked up or stored during a scan are dropped on save.
+    """
+
+    def __init__(self, path: Path, *, logger: LoggerInterface = DefaultLogger()):
+        self.path = path
+        self._logger = logger
+        self._entries: dict[str, dict] = {}
+        self._used: dict[str, dict] = {}
+
+    def load(self) -> None:
+        """Load entries from disk, starting empty if the cache is missing or invalid."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"failed to load prompt cache {self.path}: {e}")
+            return
+
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get(
+        self,
+        md_file: Path,
+        folder: Path,
+        skip_frontmatter: bool,
+        stamp: tuple[int, int],
+    ) -> Optional[PromptData]:
+        """Return cached PromptData if the entry is still fresh."""
+        key = str(md_file)
+        entry = self._entries.get(key)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("stamp") != list(stamp)
+            or entry.get("folder") != str(folder)
+            or entry.get("skip_frontmatter") != skip_frontmatter
+        ):
+            return None
+
+        try:
+            data = dict(entry["data"])
+            data["arguments"] = [Argument(**arg) for arg in data["arguments"]]
+            prompt_data = PromptData(**data)
+        except (KeyError, TypeError, ValueError):
+            # Malformed entry, treat it as a miss so the file is re-parsed
+            return None
+
+        self._used[key] = entry
+        return prompt_data
+
+    def put(
+        self,
+        md_file: Path,
+        folder: Path,
+        skip_frontmatter: bool,
+        stamp: tuple[int, int],
+        prompt_data: PromptData,
+    ) -> None:
+        """Store PromptData for a file."""
+        self._used[str(md_file)] = {
+            "stamp": list(stamp),
+            "folder": str(folder),
+            "skip_frontmatter": skip_frontmatter,
+            "data": asdict(prompt_data),
+        }
+
+    def save(self) -> None:
+        """Atomically write entries used in this run back to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file, so concurrent servers never share one
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp"
+            )
+        except OSError as e:
+            self._logger.warning(f"failed to save prompt cache {self.path}: {e}")
+            return
+
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entries": self._used}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self._logger.warning(f"failed to save prompt cache {self.path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,9 +1,11 @@
 """Local file-based prompt loader."""
 
 import frontmatter
+import yaml
 from pathlib import Path
-from typing import Iterator, Optional, Any
+from typing import Callable, Iterator, Optional, Any, Union
 from ..model import Argument, PromptData
+from .cache import PromptCache
 from ..interfaces import (
     FileSystemInterface,
     DefaultFileSystem,
@@ -15,17 +17,22 @@ from ..interfaces import (
 def _extract_string_field(
     metadata: dict,
     field: str,
-    default: str,
+    default: Union[str, Callable[[], str]],
     file_path: Path,
     *,
     logger: LoggerInterface,
 ) -> str:
-    """Extract and validate a string field from frontmatter metadata."""
+    """
+    Extract and validate a string field from frontmatter metadata.
+
+    default may be a callable, which is only called when the field is missing.
+    """
     value = metadata.get(field)
-    if value is None:
-        return default
-    elif isinstance(value, str):
+    # Check the common well-formed case first
+    if isinstance(value, str):
         return value
+    elif value is None:
+        return default() if callable(default) else default
     else:
         logger.warning(
             f"'{field}' field in {file_path} is not a string, converting to string"
@@ -83,12 +90,16 @@ def _parse_arguments(
             logger.warning(f"'arguments' field in {file_path} is not a list, ignoring")
         return []
 
-    arguments = []
-    for arg_data in frontmatter_arguments:
-        arg = _parse_argument(arg_data, file_path, logger=logger)
-        if arg:
-            arguments.append(arg)
-    return arguments
+    return [
+        arg
+        for arg_data in frontmatter_arguments
+        if (arg := _parse_argument(arg_data, file_path, logger=logger)) is not None
+    ]
+
+
+def _default_description(md_file: Path, folder: Path) -> str:
+    """Build the fallback description from the file path relative to folder."""
+    return f"Prompt from {md_file.relative_to(folder)}"
 
 
 def _parse_markdown_file(
@@ -100,36 +111,67 @@ def _parse_markdown_file(
     logger: LoggerInterface,
 ) -> PromptData:
     """Parse a single markdown file into PromptData."""
-    default_description = f"Prompt from {md_file.relative_to(folder)}"
-
     if skip_frontmatter:
         # Skip frontmatter processing, use file content as-is
         return PromptData(
             name=md_file.stem,
             title=md_file.stem,
-            description=default_description,
+            description=_default_description(md_file, folder),
             arguments=[],
             content=content,
         )
 
-    post = frontmatter.loads(content)
+    # parse() never reaches the YAML parser when there is no frontmatter
+    # header, and unlike loads() it doesn't build an intermediate Post
+    metadata, body = frontmatter.parse(content)
 
-    name = _extract_string_field(
-        post.metadata, "name", md_file.stem, md_file, logger=logger
-    )
+    name = _extract_string_field(metadata, "name", md_file.stem, md_file, logger=logger)
     title = _extract_string_field(
-        post.metadata, "title", md_file.stem, md_file, logger=logger
+        metadata, "title", md_file.stem, md_file, logger=logger
     )
+    # Only build the default description when frontmatter doesn't provide one
     description = _extract_string_field(
-        post.metadata,
+        metadata,
         "description",
-        default_description,
+        lambda: _default_description(md_file, folder),
         md_file,
         logger=logger,
     )
-    arguments = _parse_arguments(post.metadata, md_file, logger=logger)
+    arguments = _parse_arguments(metadata, md_file, logger=logger)
+
+    return PromptData(name, title, description, arguments, body)
+
+
+def _load_markdown_file(
+    md_file: Path,
+    folder: Path,
+    skip_frontmatter: bool,
+    *,
+    fs: FileSystemInterface,
+    logger: LoggerInterface,
+    cache: Optional[PromptCache],
+) -> Optional[PromptData]:
+    """Read and parse a single markdown file, logging and skipping on failure."""
+    try:
+        if cache is None:
+            content = fs.read_text(md_file)
+            return _parse_markdown_file(
+                md_file, folder, content, skip_frontmatter, logger=logger
+            )
 
-    return PromptData(name, title, description, arguments, post.content)
+        stamp = fs.file_stamp(md_file)
+        prompt_data = cache.get(md_file, folder, skip_frontmatter, stamp)
+        if prompt_data is None:
+            content = fs.read_text(md_file)
+            prompt_data = _parse_markdown_file(
+                md_file, folder, content, skip_frontmatter, logger=logger
+            )
+            cache.put(md_file, folder, skip_frontmatter, stamp, prompt_data)
+        return prompt_data
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        # ValueError also covers UnicodeDecodeError
+        logger.warning(f"failed to process {md_file}: {e}")
+        return None
 
 
 def scan_markdown_files(
@@ -138,6 +180,7 @@ def scan_markdown_files(
     *,
     fs: FileSystemInterface = DefaultFileSystem(),
     logger: LoggerInterface = DefaultLogger(),
+    cache: Optional[PromptCache] = None,
 ) -> Iterator[PromptData]:
     """
     Scan folder recursively for markdown files.
@@ -146,6 +189,7 @@ def scan_markdown_files(
         folder_path: Path to folder to scan
         fs: File system interface for file operations
         logger: Logger interface for warning messages
+        cache: Optional cache to reuse PromptData of unchanged files
 
     Yields:
         PromptData for each markdown file
@@ -157,12 +201,8 @@ def scan_markdown_files(
         return
 
     for md_file in fs.glob_markdown(folder):
-        try:
-            content = fs.read_text(md_file)
-            prompt_data = _parse_markdown_file(
-                md_file, folder, content, skip_frontmatter, logger=logger
-            )
+        prompt_data = _load_markdown_file(
+            md_file, folder, skip_frontmatter, fs=fs, logger=logger, cache=cache
+        )
+        if prompt_data is not None:
             yield prompt_data
-        except Exception as e:
-            logger.warning(f"failed to process {md_file}: {e}")
-            continue
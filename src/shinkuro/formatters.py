@@ -1,17 +1,13 @@
 """Template formatters for different variable syntax."""
 
-import re
 import string
 from typing import Protocol, Dict, Any
 from .model import FormatterType
 
-# Python identifier pattern for argument names and template variables
-IDENTIFIER_PATTERN = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
-
 
 def validate_variable_name(name: str) -> bool:
-    """Validate that a variable name is a valid Python identifier."""
-    return bool(re.match(IDENTIFIER_PATTERN, name))
+    """Validate that a variable name is a valid ASCII Python identifier."""
+    return name.isascii() and name.isidentifier()
 
 
 class FormatterInterface(Protocol):
@@ -32,15 +28,19 @@ class BraceFormatter:
     def extract_arguments(self, content: str) -> set[str]:
         formatter = string.Formatter()
         arguments = set()
-        for _, field_name, _, _ in formatter.parse(content):
+        for _, field_name, format_spec, _ in formatter.parse(content):
             if field_name:
                 if not validate_variable_name(field_name):
                     raise ValueError(f"Invalid variable name: {field_name}")
                 arguments.add(field_name)
+            if format_spec:
+                # Fields nested in a format spec, e.g. {value:>{width}}, are
+                # substituted at render time too
+                arguments |= self.extract_arguments(format_spec)
         return arguments
 
     def format(self, content: str, variables: Dict[str, Any]) -> str:
-        return content.format(**variables)
+        return content.format_map(variables)
 
 
 class DollarFormatter:
@@ -48,11 +48,11 @@ class DollarFormatter:
 
     def extract_arguments(self, content: str) -> set[str]:
         try:
-            template = string.Template(content)
             arguments = set()
-            for match in template.pattern.finditer(content):
-                if match.group("named"):
-                    param = match.group("named")
+            # Template.pattern is compiled once per class, no need for an instance
+            for match in string.Template.pattern.finditer(content):
+                param = match.group("named")
+                if param:
                     if not validate_variable_name(param):
                         raise ValueError(f"Invalid variable name: {param}")
                     arguments.add(param)
@@ -65,12 +65,16 @@ class DollarFormatter:
         return template.safe_substitute(variables)
 
 
+# Formatters are stateless, so share one instance of each
+FORMATTERS: Dict[FormatterType, FormatterInterface] = {
+    FormatterType.BRACE: BraceFormatter(),
+    FormatterType.DOLLAR: DollarFormatter(),
+}
+
+
 def get_formatter(formatter_type: FormatterType) -> FormatterInterface:
     """Get formatter by type."""
-    formatters = {
-        FormatterType.BRACE: BraceFormatter(),
-        FormatterType.DOLLAR: DollarFormatter(),
-    }
-    if formatter_type not in formatters:
+    try:
+        return FORMATTERS[formatter_type]
+    except KeyError:
         raise ValueError(f"Unknown formatter: {formatter_type}")
-    return formatters[formatter_type]
@@ -1,9 +1,9 @@
 """Interfaces for dependency injection and testing."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Iterator, Protocol
-from git import Repo
 
 
 class FileSystemInterface(Protocol):
@@ -14,7 +14,7 @@ class FileSystemInterface(Protocol):
         ...
 
     def glob_markdown(self, folder: Path) -> Iterator[Path]:
-        """Find all markdown files in folder recursively."""
+        """Find all markdown files (.md in any case) in folder recursively."""
         ...
 
     def exists(self, path: Path) -> bool:
@@ -25,6 +25,10 @@ class FileSystemInterface(Protocol):
         """Check if path is a directory."""
         ...
 
+    def file_stamp(self, path: Path) -> tuple[int, int]:
+        """Get (mtime_ns, size) of a file for change detection."""
+        ...
+
 
 class LoggerInterface(Protocol):
     """Protocol for logging operations."""
@@ -46,20 +50,48 @@ class GitInterface(Protocol):
         ...
 
 
+def _scandir_markdown(folder: str) -> Iterator[str]:
+    """Yield markdown file paths under folder using an iterative os.scandir walk."""
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            # Don't recurse into symlinked directories, same as Path.rglob
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(".md") and entry.is_file():
+                yield entry.path
+
+        # Reversed so subdirectories are popped in scandir order, like rglob
+        stack.extend(reversed(subdirs))
+
+
 class DefaultFileSystem:
-    """Default file system implementation using pathlib."""
+    """Default file system implementation using os and os.path."""
 
     def read_text(self, path: Path) -> str:
-        return path.read_text(encoding="utf-8")
+        with open(path, encoding="utf-8") as f:
+            return f.read()
 
     def glob_markdown(self, folder: Path) -> Iterator[Path]:
-        return folder.rglob("*.md")
+        return (Path(p) for p in _scandir_markdown(str(folder)))
 
     def exists(self, path: Path) -> bool:
-        return path.exists()
+        return os.path.exists(path)
 
     def is_dir(self, path: Path) -> bool:
-        return path.is_dir()
+        return os.path.isdir(path)
+
+    def file_stamp(self, path: Path) -> tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
 
 
 class DefaultLogger:
@@ -73,9 +105,14 @@ class DefaultGit:
     """Default git implementation using GitPython."""
 
     def clone(self, url: str, path: Path) -> None:
+        from git import Repo
+
         path.parent.mkdir(parents=True, exist_ok=True)
-        Repo.clone_from(url, path, depth=1)
+        # Only the latest snapshot of one branch is needed to read prompts
+        Repo.clone_from(url, path, depth=1, single_branch=True, no_tags=True)
 
     def pull(self, path: Path) -> None:
+        from git import Repo
+
         repo = Repo(path)
         repo.remotes.origin.pull()
@@ -2,13 +2,12 @@
 
 import typer
 from pathlib import Path
-from fastmcp import FastMCP
 from typing_extensions import Annotated
 
 from . import __version__
+from .file.cache import PromptCache, get_prompt_cache_path
 from .file.scan import scan_markdown_files
 from .loader import get_folder_path
-from .prompts.markdown import MarkdownPrompt
 from .formatters import get_formatter
 from .model import FormatterType
 from typing import Optional
@@ -37,7 +36,10 @@ def app(
     ] = None,
     cache_dir: Annotated[
         str,
-        typer.Option(envvar="CACHE_DIR", help="Directory to cache remote repositories"),
+        typer.Option(
+            envvar="CACHE_DIR",
+            help="Directory to cache remote repositories and parsed prompts",
+        ),
     ] = "~/.shinkuro/remote",
     auto_pull: Annotated[
         bool,
@@ -67,6 +69,14 @@ def app(
             help="Skip frontmatter processing and use raw markdown content",
         ),
     ] = False,
+    cache_prompts: Annotated[
+        bool,
+        typer.Option(
+            "--cache-prompts",
+            envvar="CACHE_PROMPTS",
+            help="Cache parsed prompts in the cache dir and only re-parse changed files on startup",
+        ),
+    ] = False,
     _version: Annotated[
         Optional[bool],
         typer.Option(
@@ -75,23 +85,42 @@ def app(
     ] = None,
 ):
     """Shinkuro - Universal prompt loader MCP server"""
-    mcp = FastMCP(name="shinkuro")
-
+    cache_path = Path(cache_dir).expanduser()
     try:
-        folder_path = get_folder_path(
-            folder, git_url, Path(cache_dir).expanduser(), auto_pull
-        )
+        folder_path = get_folder_path(folder, git_url, cache_path, auto_pull)
         formatter = get_formatter(variable_format)
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
-    for prompt_data in scan_markdown_files(folder_path, skip_frontmatter):
+    # fastmcp pulls in pydantic and mcp, import it only once we actually serve
+    # so --version, --help and config errors return quickly
+    from fastmcp import FastMCP
+    from .prompts.markdown import MarkdownPrompt
+
+    mcp = FastMCP(name="shinkuro")
+
+    prompt_cache = None
+    if cache_prompts:
+        # Relative folders like ./prompts must map to a different cache file
+        # per project, so key the cache (and its entries) by absolute path
+        folder_path = folder_path.resolve()
+        prompt_cache = PromptCache(
+            get_prompt_cache_path(cache_path, folder_path, skip_frontmatter)
+        )
+        prompt_cache.load()
+
+    for prompt_data in scan_markdown_files(
+        folder_path, skip_frontmatter, cache=prompt_cache
+    ):
         prompt = MarkdownPrompt.from_prompt_data(
             prompt_data, formatter, auto_discover_args
         )
         mcp.add_prompt(prompt)
 
+    if prompt_cache is not None:
+        prompt_cache.save()
+
     mcp.run()
 
 
@@ -10,7 +10,7 @@ class FormatterType(Enum):
     DOLLAR = "dollar"
 
 
-@dataclass
+@dataclass(slots=True)
 class Argument:
     """Template argument for prompt substitution.
 
@@ -25,7 +25,7 @@ class Argument:
     default: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptData:
     """Complete prompt data loaded from markdown file.
 
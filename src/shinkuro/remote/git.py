@@ -1,9 +1,34 @@
 """Git repository cloning and caching."""
 
+import re
 from pathlib import Path
-from giturlparse import parse
 from ..interfaces import GitInterface, DefaultGit
 
+# scheme://[user[:token]@]host[:port]/ or scp-like user@host: prefix, then the
+# owner as the first path segment and the repo name as the last one (so GitLab
+# subgroups and Azure DevOps paths resolve to owner/repo)
+GIT_URL_RE = re.compile(
+    r"^(?:[a-zA-Z][a-zA-Z0-9+.-]*://[^/]+/|[^@/:]+@[^/:]+:)"
+    r"(?P<owner>[^/]+)/(?:[^/]+/)*?(?P<name>[^/]+?)(?:\.git)?/?$"
+)
+
+# Owner and repo names become cache directory names, so only allow plain
+# names (no separators, no "." or "..")
+SAFE_PATH_COMPONENT_RE = re.compile(r"\A(?!\.\.?\Z)[A-Za-z0-9_.-]+\Z")
+
+
+def _parse_git_url(git_url: str) -> tuple[str, str]:
+    """Extract (owner, name) from a git URL."""
+    match = GIT_URL_RE.match(git_url)
+    if not match:
+        raise ValueError(f"Cannot extract user/repo from git URL: {git_url}")
+
+    owner, name = match["owner"], match["name"]
+    if not (SAFE_PATH_COMPONENT_RE.match(owner) and SAFE_PATH_COMPONENT_RE.match(name)):
+        raise ValueError(f"Unsafe user/repo in git URL: {git_url}")
+
+    return owner, name
+
 
 def get_local_cache_path(git_url: str, cache_dir: Path) -> Path:
     """
@@ -16,14 +41,8 @@ def get_local_cache_path(git_url: str, cache_dir: Path) -> Path:
     Returns:
         Local path where the repository would be cached
     """
-    parsed = parse(git_url)
-    owner = getattr(parsed, "owner", None)
-    name = getattr(parsed, "name", None)
-
-    if not owner or not name:
-        raise ValueError(f"Cannot extract user/repo from git URL: {git_url}")
-
-    return cache_dir / "git" / str(owner) / str(name)
+    owner, name = _parse_git_url(git_url)
+    return cache_dir.joinpath("git", owner, name)
 
 
 def clone_or_update_repo(
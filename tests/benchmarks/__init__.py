@@ -0,0 +1 @@
+"""Benchmarks for shinkuro, run with `pytest -m benchmark`."""
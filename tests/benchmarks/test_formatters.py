@@ -0,0 +1,61 @@
+"""Benchmarks for formatters module."""
+
+import pytest
+from shinkuro.formatters import (
+    BraceFormatter,
+    DollarFormatter,
+    validate_variable_name,
+)
+
+pytestmark = pytest.mark.benchmark(group="formatters")
+
+BRACE_CONTENT = "Hello {user}! Welcome to {project}. Use {{braces}} freely.\n" * 50
+DOLLAR_CONTENT = "Hello $user! Welcome to $project. Costs $$5.\n" * 50
+# Mostly literal text with a few fields, like a typical long prompt
+PROSE_CONTENT = ("Review the change for correctness and style. " * 170) + "{user}"
+SHORT_CONTENT = "Say: Hello {user}! Welcome to {project}."
+VARIABLES = {"user": "Alice", "project": "Shinkuro"}
+
+
+def test_benchmark_brace_extract_arguments(benchmark):
+    arguments = benchmark(BraceFormatter().extract_arguments, BRACE_CONTENT)
+
+    assert arguments == {"user", "project"}
+
+
+def test_benchmark_brace_extract_arguments_prose(benchmark):
+    arguments = benchmark(BraceFormatter().extract_arguments, PROSE_CONTENT)
+
+    assert arguments == {"user"}
+
+
+def test_benchmark_brace_extract_arguments_short(benchmark):
+    arguments = benchmark(BraceFormatter().extract_arguments, SHORT_CONTENT)
+
+    assert arguments == {"user", "project"}
+
+
+def test_benchmark_brace_format(benchmark):
+    result = benchmark(BraceFormatter().format, BRACE_CONTENT, VARIABLES)
+
+    assert result.startswith("Hello Alice! Welcome to Shinkuro. Use {braces} freely.")
+
+
+def test_benchmark_dollar_extract_arguments(benchmark):
+    arguments = benchmark(DollarFormatter().extract_arguments, DOLLAR_CONTENT)
+
+    assert arguments == {"user", "project"}
+
+
+def test_benchmark_dollar_format(benchmark):
+    result = benchmark(DollarFormatter().format, DOLLAR_CONTENT, VARIABLES)
+
+    assert result.startswith("Hello Alice! Welcome to Shinkuro. Costs $5.")
+
+
+def test_benchmark_validate_variable_name(benchmark):
+    names = ["user", "_private", "user123", "123user", "user-name", "ユーザー"] * 100
+
+    result = benchmark(lambda: [validate_variable_name(name) for name in names])
+
+    assert result.count(True) == 300
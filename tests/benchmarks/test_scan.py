@@ -0,0 +1,50 @@
+"""Benchmarks for loading a prompt folder."""
+
+import pytest
+from shinkuro.file.scan import scan_markdown_files
+from shinkuro.formatters import BraceFormatter
+from shinkuro.prompts.markdown import MarkdownPrompt
+from ..fixtures import create_markdown_file_content, write_file_tree
+
+pytestmark = pytest.mark.benchmark(group="scan")
+
+
+@pytest.fixture
+def prompt_folder(tmp_path):
+    content = create_markdown_file_content(
+        content="Hello {user}! Welcome to {project}.",
+        description="Greeting",
+        arguments=[
+            {"name": "user", "description": "User name"},
+            {"name": "project", "description": "Project name", "default": "MyApp"},
+        ],
+    )
+    write_file_tree(
+        tmp_path,
+        {f"dir{i}/nested/prompt{j}.md": content for i in range(20) for j in range(50)},
+    )
+    return tmp_path
+
+
+def test_benchmark_scan_markdown_files(benchmark, prompt_folder):
+    prompts = benchmark(
+        lambda: list(scan_markdown_files(prompt_folder, skip_frontmatter=False))
+    )
+
+    assert len(prompts) == 1000
+
+
+def test_benchmark_load_prompts(benchmark, prompt_folder):
+    formatter = BraceFormatter()
+
+    def load():
+        return [
+            MarkdownPrompt.from_prompt_data(prompt_data, formatter)
+            for prompt_data in scan_markdown_files(
+                prompt_folder, skip_frontmatter=False
+            )
+        ]
+
+    prompts = benchmark(load)
+
+    assert len(prompts) == 1000
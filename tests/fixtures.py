@@ -1,5 +1,6 @@
 """Test fixtures and factories for creating test data."""
 
+import os
 from pathlib import Path
 from shinkuro.model import Argument, PromptData
 
@@ -64,3 +65,18 @@ def create_markdown_file_content(
 def create_test_files(files: dict[str, str]) -> dict[Path, str]:
     """Convert string paths to Path objects for MockFileSystem."""
     return {Path(path): content for path, content in files.items()}
+
+
+def write_file_tree(root: Path, files: dict[str, str]) -> list[Path]:
+    """Write files given as relative path -> content under root on disk."""
+    created_dirs = set()
+    paths = []
+    for relative_path, content in files.items():
+        path = root / relative_path
+        if path.parent not in created_dirs:
+            os.makedirs(path.parent, exist_ok=True)
+            created_dirs.add(path.parent)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        paths.append(path)
+    return paths
@@ -22,6 +22,9 @@ class MockFileSystem:
     def is_dir(self, path: Path) -> bool:
         return path == Path("/test")
 
+    def file_stamp(self, path: Path) -> tuple[int, int]:
+        return 0, len(self.files[path])
+
 
 class MockLogger:
     """Mock logger for testing."""
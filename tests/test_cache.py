@@ -0,0 +1,136 @@
+"""Tests for file/cache.py module."""
+
+import json
+from pathlib import Path
+from shinkuro.file.cache import CACHE_VERSION, PromptCache, get_prompt_cache_path
+from shinkuro.file.scan import scan_markdown_files
+from .mocks import MockFileSystem, MockLogger
+from .fixtures import create_argument, create_prompt_data, create_test_files
+
+
+def test_prompt_cache_round_trip(tmp_path):
+    cache_file = tmp_path / "prompts.json"
+    prompt_data = create_prompt_data(
+        arguments=[create_argument("user", "User name", "guest")]
+    )
+
+    cache = PromptCache(cache_file)
+    cache.put(Path("/test/a.md"), Path("/test"), False, (1, 2), prompt_data)
+    cache.save()
+
+    loaded = PromptCache(cache_file)
+    loaded.load()
+
+    assert loaded.get(Path("/test/a.md"), Path("/test"), False, (1, 2)) == prompt_data
+
+
+def test_prompt_cache_stale_entry(tmp_path):
+    cache_file = tmp_path / "prompts.json"
+    cache = PromptCache(cache_file)
+    cache.put(Path("/test/a.md"), Path("/test"), False, (1, 2), create_prompt_data())
+    cache.save()
+
+    loaded = PromptCache(cache_file)
+    loaded.load()
+
+    assert loaded.get(Path("/test/a.md"), Path("/test"), False, (1, 3)) is None
+    assert loaded.get(Path("/test/a.md"), Path("/test"), True, (1, 2)) is None
+    assert loaded.get(Path("/test/a.md"), Path("/other"), False, (1, 2)) is None
+
+
+def test_prompt_cache_drops_unused_entries(tmp_path):
+    cache_file = tmp_path / "prompts.json"
+    cache = PromptCache(cache_file)
+    cache.put(Path("/test/a.md"), Path("/test"), False, (1, 2), create_prompt_data())
+    cache.save()
+
+    second = PromptCache(cache_file)
+    second.load()
+    second.save()
+
+    third = PromptCache(cache_file)
+    third.load()
+    assert third.get(Path("/test/a.md"), Path("/test"), False, (1, 2)) is None
+
+
+def test_prompt_cache_invalid_file(tmp_path):
+    cache_file = tmp_path / "prompts.json"
+    cache_file.write_text("not json")
+    logger = MockLogger()
+
+    cache = PromptCache(cache_file, logger=logger)
+    cache.load()
+
+    assert len(logger.warnings) == 1
+    assert "failed to load prompt cache" in logger.warnings[0]
+
+
+def test_scan_markdown_files_uses_cache(tmp_path):
+    fs = MockFileSystem(create_test_files({"/test/file.md": "Content"}))
+    cache = PromptCache(tmp_path / "prompts.json")
+    list(scan_markdown_files(Path("/test"), False, fs=fs, cache=cache))
+    cache.save()
+
+    # Same size, so the stamp still matches and the cached entry is used
+    fs.files[Path("/test/file.md")] = "Changed"
+    cache = PromptCache(tmp_path / "prompts.json")
+    cache.load()
+    results = list(scan_markdown_files(Path("/test"), False, fs=fs, cache=cache))
+
+    assert [r.content for r in results] == ["Content"]
+
+
+def test_get_prompt_cache_path_per_scan_root(tmp_path):
+    path_a = get_prompt_cache_path(tmp_path, Path("/test/a"), False)
+    path_b = get_prompt_cache_path(tmp_path, Path("/test/b"), False)
+    path_skip = get_prompt_cache_path(tmp_path, Path("/test/a"), True)
+
+    assert path_a == get_prompt_cache_path(tmp_path, Path("/test/a"), False)
+    assert len({path_a, path_b, path_skip}) == 3
+    assert all(p.parent == tmp_path / "prompts" for p in (path_a, path_b, path_skip))
+
+
+def test_prompt_cache_separate_scan_roots_keep_entries(tmp_path):
+    path_a = get_prompt_cache_path(tmp_path, Path("/test"), False)
+    cache_a = PromptCache(path_a)
+    cache_a.put(Path("/test/a.md"), Path("/test"), False, (1, 2), create_prompt_data())
+    cache_a.save()
+
+    path_b = get_prompt_cache_path(tmp_path, Path("/other"), False)
+    cache_b = PromptCache(path_b)
+    cache_b.load()
+    cache_b.put(
+        Path("/other/b.md"), Path("/other"), False, (1, 2), create_prompt_data()
+    )
+    cache_b.save()
+
+    loaded = PromptCache(path_a)
+    loaded.load()
+    assert loaded.get(Path("/test/a.md"), Path("/test"), False, (1, 2)) is not None
+    assert list(tmp_path.glob("prompts/*.tmp")) == []
+
+
+def test_prompt_cache_malformed_entries(tmp_path):
+    cache_file = tmp_path / "prompts.json"
+    cache_file.write_text(
+        json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "entries": {
+                    "/test/a.md": ["not", "a", "dict"],
+                    "/test/b.md": {
+                        "stamp": [1, 2],
+                        "folder": "/test",
+                        "skip_frontmatter": False,
+                        "data": ["not", "a", "dict"],
+                    },
+                },
+            }
+        )
+    )
+
+    cache = PromptCache(cache_file)
+    cache.load()
+
+    assert cache.get(Path("/test/a.md"), Path("/test"), False, (1, 2)) is None
+    assert cache.get(Path("/test/b.md"), Path("/test"), False, (1, 2)) is None
@@ -22,6 +22,8 @@ def test_validate_variable_name_invalid():
     assert validate_variable_name("user-name") is False
     assert validate_variable_name("user name") is False
     assert validate_variable_name("") is False
+    assert validate_variable_name("user\n") is False
+    assert validate_variable_name("usér") is False
 
 
 def test_brace_formatter_extract_arguments():
@@ -36,6 +38,36 @@ def test_brace_formatter_extract_arguments_invalid():
         formatter.extract_arguments("Hello {123}")
 
 
+def test_brace_formatter_extract_arguments_escaped_braces():
+    formatter = BraceFormatter()
+    arguments = formatter.extract_arguments("{{literal}} {{{user}}}")
+    assert arguments == {"user"}
+
+
+def test_brace_formatter_extract_arguments_conversion_and_spec():
+    formatter = BraceFormatter()
+    arguments = formatter.extract_arguments("{user!r} {project:>10}")
+    assert arguments == {"user", "project"}
+
+
+def test_brace_formatter_extract_arguments_nested_spec():
+    formatter = BraceFormatter()
+    arguments = formatter.extract_arguments("{count:>{width}} {value:{fill}^{size}}")
+    assert arguments == {"count", "width", "value", "fill", "size"}
+
+
+def test_brace_formatter_extract_arguments_nested_spec_invalid():
+    formatter = BraceFormatter()
+    with pytest.raises(ValueError, match="Invalid variable name: b.__class__"):
+        formatter.extract_arguments("{a:{b.__class__}}")
+
+
+def test_brace_formatter_extract_arguments_single_brace():
+    formatter = BraceFormatter()
+    with pytest.raises(ValueError, match="Single '}' encountered"):
+        formatter.extract_arguments("Hello user}")
+
+
 def test_brace_formatter_format():
     formatter = BraceFormatter()
     result = formatter.format("Hello {user}!", {"user": "Alice"})
@@ -48,6 +80,12 @@ def test_dollar_formatter_extract_arguments():
     assert arguments == {"user", "project"}
 
 
+def test_dollar_formatter_extract_arguments_ignores_braced():
+    formatter = DollarFormatter()
+    arguments = formatter.extract_arguments("Hello $user from ${HOME}, $$escaped")
+    assert arguments == {"user"}
+
+
 def test_dollar_formatter_format():
     formatter = DollarFormatter()
     result = formatter.format("Hello $user!", {"user": "Alice"})
@@ -73,3 +111,7 @@ def test_get_formatter_dollar():
 def test_get_formatter_invalid():
     with pytest.raises(ValueError, match="Unknown formatter"):
         get_formatter("invalid")  # type: ignore
+
+
+def test_get_formatter_returns_shared_instance():
+    assert get_formatter(FormatterType.BRACE) is get_formatter(FormatterType.BRACE)
@@ -69,6 +69,42 @@ def test_get_local_cache_path_gitlab_with_credentials():
     assert result == Path("/cache/git/owner/repo")
 
 
+def test_get_local_cache_path_gitlab_subgroup():
+    cache_dir = Path("/cache")
+    git_url = "https://gitlab.com/group/subgroup/repo.git"
+
+    result = get_local_cache_path(git_url, cache_dir)
+
+    assert result == Path("/cache/git/group/repo")
+
+
+def test_get_local_cache_path_ssh_with_port():
+    cache_dir = Path("/cache")
+    git_url = "ssh://git@example.com:2222/user/repo.git"
+
+    result = get_local_cache_path(git_url, cache_dir)
+
+    assert result == Path("/cache/git/user/repo")
+
+
+def test_get_local_cache_path_dot_name():
+    cache_dir = Path("/cache")
+    git_url = "https://github.com/owner/.github.git"
+
+    result = get_local_cache_path(git_url, cache_dir)
+
+    assert result == Path("/cache/git/owner/.github")
+
+
+def test_get_local_cache_path_unsafe_component():
+    cache_dir = Path("/cache")
+
+    with pytest.raises(ValueError, match="Unsafe user/repo"):
+        get_local_cache_path("https://github.com/../repo.git", cache_dir)
+    with pytest.raises(ValueError, match="Unsafe user/repo"):
+        get_local_cache_path("https://host/~user/repo.git", cache_dir)
+
+
 def test_get_local_cache_path_invalid_url():
     cache_dir = Path("/cache")
     git_url = "invalid-url"
@@ -3,6 +3,7 @@
 import sys
 from io import StringIO
 from shinkuro.interfaces import DefaultFileSystem, DefaultLogger, DefaultGit
+from .fixtures import write_file_tree
 
 
 def test_default_filesystem_read_text(tmp_path):
@@ -16,12 +17,15 @@ def test_default_filesystem_read_text(tmp_path):
 
 
 def test_default_filesystem_glob_markdown(tmp_path):
-    (tmp_path / "file1.md").write_text("content1")
-    (tmp_path / "file2.md").write_text("content2")
-    (tmp_path / "file3.txt").write_text("content3")
-    subdir = tmp_path / "subdir"
-    subdir.mkdir()
-    (subdir / "file4.md").write_text("content4")
+    write_file_tree(
+        tmp_path,
+        {
+            "file1.md": "content1",
+            "file2.md": "content2",
+            "file3.txt": "content3",
+            "subdir/file4.md": "content4",
+        },
+    )
 
     fs = DefaultFileSystem()
     md_files = list(fs.glob_markdown(tmp_path))
@@ -30,6 +34,49 @@ def test_default_filesystem_glob_markdown(tmp_path):
     assert all(f.suffix == ".md" for f in md_files)
 
 
+def test_default_filesystem_glob_markdown_skips_directories(tmp_path):
+    expected = write_file_tree(
+        tmp_path, {"file.md": "content", "folder.md/nested.md": "nested"}
+    )
+
+    fs = DefaultFileSystem()
+    md_files = sorted(fs.glob_markdown(tmp_path))
+
+    assert md_files == expected
+
+
+def test_default_filesystem_glob_markdown_case_insensitive(tmp_path):
+    expected = write_file_tree(tmp_path, {"mixed.Md": "content", "upper.MD": "content"})
+
+    fs = DefaultFileSystem()
+    md_files = sorted(fs.glob_markdown(tmp_path))
+
+    assert md_files == expected
+
+
+def test_default_filesystem_glob_markdown_folder_files_first(tmp_path):
+    write_file_tree(tmp_path, {"a/nested.md": "nested", "z.md": "top"})
+
+    fs = DefaultFileSystem()
+    md_files = list(fs.glob_markdown(tmp_path))
+
+    assert md_files == [tmp_path / "z.md", tmp_path / "a" / "nested.md"]
+
+
+def test_default_filesystem_glob_markdown_large_tree(tmp_path):
+    files = {
+        f"dir{i}/nested/file{j}.md": "content" for i in range(10) for j in range(50)
+    }
+    expected = set(write_file_tree(tmp_path, files))
+    write_file_tree(tmp_path, {f"dir{i}/nested/notes.txt": "skip" for i in range(10)})
+
+    fs = DefaultFileSystem()
+    md_files = list(fs.glob_markdown(tmp_path))
+
+    assert len(md_files) == 500
+    assert set(md_files) == expected
+
+
 def test_default_filesystem_exists(tmp_path):
     test_file = tmp_path / "exists.txt"
     test_file.write_text("content")
@@ -71,10 +118,10 @@ def test_default_git_clone(tmp_path, monkeypatch):
 
     class MockRepo:
         @classmethod
-        def clone_from(cls, url, path, depth):
-            clone_called.append({"url": url, "path": path, "depth": depth})
+        def clone_from(cls, url, path, **kwargs):
+            clone_called.append({"url": url, "path": path, **kwargs})
 
-    monkeypatch.setattr("shinkuro.interfaces.Repo", MockRepo)
+    monkeypatch.setattr("git.Repo", MockRepo)
 
     git = DefaultGit()
     target = tmp_path / "repo"
@@ -84,6 +131,8 @@ def test_default_git_clone(tmp_path, monkeypatch):
     assert clone_called[0]["url"] == "https://github.com/user/repo.git"
     assert clone_called[0]["path"] == target
     assert clone_called[0]["depth"] == 1
+    assert clone_called[0]["single_branch"] is True
+    assert clone_called[0]["no_tags"] is True
     assert target.parent.exists()
 
 
@@ -102,7 +151,7 @@ def test_default_git_pull(tmp_path, monkeypatch):
             self.path = path
             self.remotes = MockRemotes()
 
-    monkeypatch.setattr("shinkuro.interfaces.Repo", MockRepo)
+    monkeypatch.setattr("git.Repo", MockRepo)
 
     git = DefaultGit()
     git.pull(tmp_path)
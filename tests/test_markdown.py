@@ -164,6 +164,36 @@ async def test_markdown_prompt_validation_invalid_argument_name():
         MarkdownPrompt.from_prompt_data(prompt_data, BraceFormatter())
 
 
+@pytest.mark.asyncio
+async def test_markdown_prompt_validation_argument_name_reported_first():
+    prompt_data = create_prompt_data(
+        arguments=[create_argument("bad-name", "Invalid name", None)],
+        content="Hello {user.x}!",
+    )
+
+    with pytest.raises(
+        ValueError, match="Argument name 'bad-name' contains invalid characters"
+    ):
+        MarkdownPrompt.from_prompt_data(prompt_data, BraceFormatter())
+
+
+@pytest.mark.asyncio
+async def test_markdown_prompt_validation_unsafe_fields():
+    for content in [
+        "{obj.__class__}",
+        "{data[key]}",
+        "{name.upper()}",
+        "{a:{b.__class__}}",
+        "{a:{b[0]}}",
+    ]:
+        prompt_data = create_prompt_data(content=content)
+
+        with pytest.raises(ValueError, match="Invalid variable name"):
+            MarkdownPrompt.from_prompt_data(
+                prompt_data, BraceFormatter(), auto_discover_args=True
+            )
+
+
 @pytest.mark.asyncio
 async def test_markdown_prompt_validation_mismatched_arguments():
     prompt_data = create_prompt_data(
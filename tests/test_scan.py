@@ -31,6 +31,27 @@ def test_extract_string_field_with_none():
     assert len(logger.warnings) == 0
 
 
+def test_extract_string_field_with_lazy_default():
+    logger = MockLogger()
+    calls = []
+
+    def default():
+        calls.append(True)
+        return "default"
+
+    assert (
+        _extract_string_field({}, "name", default, Path("/test.md"), logger=logger)
+        == "default"
+    )
+    assert (
+        _extract_string_field(
+            {"name": "test"}, "name", default, Path("/test.md"), logger=logger
+        )
+        == "test"
+    )
+    assert len(calls) == 1
+
+
 def test_extract_string_field_with_non_string():
     logger = MockLogger()
     result = _extract_string_field(
@@ -239,3 +260,28 @@ Hello world!""",
     assert greet.title == "greet"
     assert greet.description == "Prompt from nested/greet.md"
     assert greet.arguments == []
+
+
+def test_scan_markdown_files_preserves_order():
+    fs = MockFileSystem(
+        create_test_files({f"/test/file{i}.md": f"Content {i}" for i in range(20)})
+    )
+    logger = MockLogger()
+    results = list(scan_markdown_files(Path("/test"), False, fs=fs, logger=logger))
+    assert [r.name for r in results] == [f"file{i}" for i in range(20)]
+
+
+def test_scan_markdown_files_skips_invalid_yaml():
+    fs = MockFileSystem(
+        create_test_files(
+            {
+                "/test/bad.md": "---\nname: [unclosed\n---\nBody",
+                "/test/good.md": "Content",
+            }
+        )
+    )
+    logger = MockLogger()
+    results = list(scan_markdown_files(Path("/test"), False, fs=fs, logger=logger))
+    assert [r.name for r in results] == ["good"]
+    assert len(logger.warnings) == 1
+    assert "failed to process /test/bad.md" in logger.warnings[0]